@@ -106,6 +106,12 @@ function showError(title: string, message: string) {
     console.error(`ERROR: ${title} - ${message}`);
 }
 
+// --- URL Options ---
+// ?render=none runs full init but never starts the render loop (smoke tests)
+// ?debug exposes the level-warp cheats in production builds
+const urlParams = new URLSearchParams(window.location.search);
+const renderDisabled = urlParams.get('render') === 'none';
+
 // --- Scene Setup ---
 const canvas = document.querySelector('#glCanvas') as HTMLCanvasElement;
 const scene = new THREE.Scene();
@@ -239,6 +245,14 @@ loadWasm();
 // PLAYER (Rocket Character) - GLB Model Integration
 // =============================================================================
 let player: THREE.Group | null = null;
+
+// Verification readiness: renderer backend initialised and the rocket (or its
+// fallback) loaded. Checked from both places that can complete last.
+let rendererReady = false;
+function markGameReady() {
+    if (rendererReady && player) window.__gameReady = true;
+}
+
 const gltfLoader = new GLTFLoader();
 // Load the rocket GLB model
 gltfLoader.load(
@@ -295,6 +309,7 @@ gltfLoader.load(
         // Set as the player
         player = tiltGroup;
         scene.add(player);
+        markGameReady();
         
         console.log('🚀 Rocket GLB model loaded successfully!');
     },
@@ -332,6 +347,7 @@ gltfLoader.load(
         
         player = tiltGroup;
         scene.add(player);
+        markGameReady();
         
         console.warn('Using placeholder rocket due to loading error');
     }
@@ -349,6 +365,7 @@ const playerState = {
     invincible: false, // Invincibility frames after hit
     distanceToMoon: 500, // Distance to reach the moon
     hasWon: false, // Track if player has won
+    warped: false, // Set by the debug level-warp cheats; suppresses the win check
     level: 1 // Current level
 };
 
@@ -1864,11 +1881,15 @@ function updateHealthDisplay() {
     }
 }
 
+function getDistanceToMoon() {
+    if (!player) return playerState.distanceToMoon;
+    return Math.max(0, Math.floor(playerState.distanceToMoon - player.position.x));
+}
+
 function updateDistanceDisplay() {
     const distanceDiv = document.getElementById('distance-display');
     if (distanceDiv && player) {
-        const distance = Math.max(0, Math.floor(playerState.distanceToMoon - player.position.x));
-        distanceDiv.innerHTML = `Distance to Moon: ${distance}m`;
+        distanceDiv.innerHTML = `Distance to Moon: ${getDistanceToMoon()}m`;
     }
 }
 
@@ -2377,15 +2398,107 @@ function animate() {
     updateDistanceDisplay();
     
     // Check if player reached the moon
-    if (player && player.position.x >= playerState.distanceToMoon - 10 && !playerState.hasWon) {
+    if (player && player.position.x >= playerState.distanceToMoon - 10 && !playerState.hasWon && !playerState.warped) {
         playerState.hasWon = true;
         gameWin();
     }
 
     renderer.render(scene, camera);
+
+    // A rendered frame means the backend is initialised
+    if (!rendererReady) {
+        rendererReady = true;
+        markGameReady();
+    }
+    window.__frameReady = true;
+}
+
+if (renderDisabled) {
+    // Still initialise the backend so WebGPU adapter/device failures surface
+    renderer.init()
+        .then(() => {
+            rendererReady = true;
+            markGameReady();
+        })
+        .catch((err: any) => showError('Initialization Error', err?.message || 'WebGPU renderer failed to initialize.'));
+} else {
+    renderer.setAnimationLoop(animate);
 }
 
-renderer.setAnimationLoop(animate);
+// =============================================================================
+// VERIFICATION HOOKS
+// =============================================================================
+// Exposes game state so the Playwright verification scripts can wait on real
+// conditions (level loaded, effect active) instead of fixed sleeps.
+window.levelManager = {
+    get currentLevel() { return levelManager.currentLevel; }
+};
+window.__effects = {
+    get reentryActive() { return reEntrySystem.active; }
+};
+// Everything a check might assert on, read in a single evaluate round-trip
+window.__gameState = () => ({
+    level: levelManager.currentLevel,
+    levelName: levelManager.config[levelManager.currentLevel]?.name ?? '',
+    health: playerState.health,
+    distance: player ? player.position.x : 0,
+    distanceToMoon: getDistanceToMoon()
+});
+
+// Level-warp cheats. Preview builds are production builds, so `?debug` also
+// enables them for verification runs against `vite preview`.
+if (import.meta.env.DEV || urlParams.has('debug')) {
+    let loopPaused = false;
+
+    // Moves the player to x inside level n and shows that level straight away
+    const warpTo = (rocket: THREE.Group, x: number, n: number) => {
+        rocket.position.x = x;
+        camera.position.x = x;
+        levelManager.startLevel(n);
+        playerState.warped = true;
+        // Skip the sky/fog fade so the next frame already shows the new level
+        const cfg = levelManager.config[n];
+        levelManager.atmosphereSystem.setColors(cfg.skyColors.top, cfg.skyColors.bottom);
+        // Cleared until the new level has been rendered at least once
+        window.__frameReady = false;
+        if (loopPaused) {
+            // No loop will run to draw it, so render the warped frame now
+            updateCamera();
+            renderer.render(scene, camera);
+            window.__frameReady = true;
+        }
+    };
+
+    window.__cheat = {
+        jumpToLevel: (n: number) => {
+            if (!player) throw new Error('jumpToLevel: player has not loaded yet');
+            if (!gameStarted) throw new Error('jumpToLevel: game has not started (click #instructions first)');
+            if (!levelManager.config[n]) throw new Error(`jumpToLevel: no level ${n}`);
+            // Place the player at the start of the level so checkProgress doesn't skip it
+            warpTo(player, levelManager.config[n - 1]?.distance ?? 0, n);
+        },
+        setDistance: (d: number) => {
+            if (!player) throw new Error('setDistance: player has not loaded yet');
+            if (!gameStarted) throw new Error('setDistance: game has not started (click #instructions first)');
+            if (!Number.isFinite(d)) throw new Error(`setDistance: invalid distance ${d}`);
+            // Find the level whose span contains d (past the end, stay in the final level)
+            let n = 1;
+            while (levelManager.config[n + 1] && d >= levelManager.config[n].distance) n++;
+            warpTo(player, d, n);
+        }
+    };
+
+    // Freeze the game on the current frame for screenshots
+    window.__pauseLoop = () => {
+        loopPaused = true;
+        renderer.setAnimationLoop(null);
+    };
+    window.__resumeLoop = () => {
+        loopPaused = false;
+        clock.getDelta(); // Discard the paused interval
+        renderer.setAnimationLoop(animate);
+    };
+}
 
 // =============================================================================
 // RESIZE HANDLER
@@ -1,5 +1,26 @@
 /// <reference types="vite/client" />
 
+// Debug/verification hooks exposed by main.ts
+interface Window {
+  __gameReady?: boolean;
+  __frameReady?: boolean;
+  levelManager?: { readonly currentLevel: number };
+  __effects?: { readonly reentryActive: boolean };
+  __gameState?: () => {
+    level: number;
+    levelName: string;
+    health: number;
+    distance: number;
+    distanceToMoon: number;
+  };
+  __cheat?: {
+    jumpToLevel: (n: number) => void;
+    setDistance: (d: number) => void;
+  };
+  __pauseLoop?: () => void;
+  __resumeLoop?: () => void;
+}
+
 declare module 'three/examples/jsm/capabilities/WebGPU.js' {
   const WebGPU: {
     isAvailable: () => boolean;
@@ -15,6 +36,7 @@ declare module 'three/webgpu' {
     // Minimal mock for WebGPURenderer as it's not in standard @types/three yet or might differ
     export class WebGPURenderer extends WebGLRenderer {
         constructor(parameters?: WebGLRendererParameters);
+        init(): Promise<this>;
     }
 
     // Node materials (often just extended versions or using node logic)